@@ -27,6 +27,12 @@
 # Keep Gson model classes
 -keep class com.mcp.uiautomator.model.** { *; }
 
+# Keep Jackson / MessagePack serialization classes
+-keep class com.fasterxml.jackson.** { *; }
+-keep class org.msgpack.** { *; }
+-dontwarn com.fasterxml.jackson.**
+-dontwarn org.msgpack.**
+
 # Keep Ktor server classes
 -keep class io.ktor.** { *; }
 -dontwarn io.ktor.**
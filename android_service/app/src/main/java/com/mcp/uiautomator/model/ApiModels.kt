@@ -1,5 +1,6 @@
 package com.mcp.uiautomator.model
 
+import com.google.gson.JsonObject
 import com.google.gson.annotations.SerializedName
 
 /**
@@ -92,6 +93,37 @@ data class WaitRequest(
     val condition: String = "visible" // visible, gone, clickable
 )
 
+/**
+ * 批量请求中的单个操作
+ * path 为对应的单个接口路径，body 为该接口的请求体
+ */
+data class BatchOperation(
+    @SerializedName("path")
+    val path: String,
+    
+    @SerializedName("body")
+    val body: JsonObject? = null
+)
+
+/**
+ * 批量请求
+ */
+data class BatchRequest(
+    @SerializedName("ops")
+    val ops: List<BatchOperation>
+)
+
+/**
+ * 批量响应，results 与请求中的 ops 一一对应
+ */
+data class BatchResponse(
+    @SerializedName("success")
+    val success: Boolean,
+    
+    @SerializedName("results")
+    val results: List<Any>
+)
+
 /**
  * 操作响应
  */
@@ -150,4 +182,5 @@ object ErrorCodes {
     const val OPERATION_FAILED = "OPERATION_FAILED"
     const val INVALID_DIRECTION = "INVALID_DIRECTION"
     const val SERVICE_ERROR = "SERVICE_ERROR"
+    const val UNSUPPORTED_OPERATION = "UNSUPPORTED_OPERATION"
 }
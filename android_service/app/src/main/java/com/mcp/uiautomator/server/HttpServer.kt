@@ -2,20 +2,26 @@ package com.mcp.uiautomator.server
 
 import android.content.Context
 import android.util.Log
+import com.fasterxml.jackson.databind.ObjectMapper
+import com.fasterxml.jackson.databind.PropertyNamingStrategies
+import com.fasterxml.jackson.module.kotlin.registerKotlinModule
 import com.google.gson.Gson
 import com.mcp.uiautomator.core.DebugLogger
 import com.mcp.uiautomator.core.UIAutomatorHelper
 import com.mcp.uiautomator.model.*
 import io.ktor.http.*
 import io.ktor.serialization.gson.*
+import io.ktor.serialization.jackson.*
 import io.ktor.server.application.*
 import io.ktor.server.engine.*
 import io.ktor.server.netty.*
+import io.ktor.server.plugins.compression.*
 import io.ktor.server.plugins.contentnegotiation.*
 import io.ktor.server.request.*
 import io.ktor.server.response.*
 import io.ktor.server.routing.*
 import kotlinx.coroutines.*
+import org.msgpack.jackson.dataformat.MessagePackFactory
 
 /**
  * HTTP服务器
@@ -27,6 +33,9 @@ class HttpServer(
 ) {
     companion object {
         private const val TAG = "HttpServer"
+        
+        // 二进制响应格式，体积更小、解析更快
+        private val MSGPACK_CONTENT_TYPE = ContentType("application", "msgpack")
     }
     
     private var server: NettyApplicationEngine? = null
@@ -84,6 +93,28 @@ class HttpServer(
                 setPrettyPrinting()
                 setLenient()
             }
+            // 客户端在Accept中声明application/msgpack时返回MessagePack
+            // 字段名使用snake_case，与Gson的@SerializedName保持一致
+            register(
+                MSGPACK_CONTENT_TYPE,
+                JacksonConverter(
+                    ObjectMapper(MessagePackFactory())
+                        .registerKotlinModule()
+                        .setPropertyNamingStrategy(PropertyNamingStrategies.SNAKE_CASE)
+                )
+            )
+        }
+        
+        // UI树数据重复字段多、压缩率高，客户端声明Accept-Encoding时压缩响应
+        install(Compression) {
+            gzip {
+                priority = 1.0
+                minimumSize(1024)
+            }
+            deflate {
+                priority = 0.9
+                minimumSize(1024)
+            }
         }
         
         routing {
@@ -321,6 +352,29 @@ class HttpServer(
                 }
             }
             
+            // 批量操作，一次请求执行多个操作
+            post("/batch") {
+                try {
+                    val request = call.receive<BatchRequest>()
+                    debugLogger.logApiCall("POST", "/batch", "${request.ops.size} ops")
+                    
+                    val results = request.ops.map { executeBatchOperation(it) }
+                    debugLogger.logApiCall("POST", "/batch", null, 200)
+                    call.respond(HttpStatusCode.OK, BatchResponse(success = true, results = results))
+                } catch (e: Exception) {
+                    debugLogger.error("Failed to process batch request", e)
+                    debugLogger.logApiCall("POST", "/batch", null, 400)
+                    call.respond(
+                        HttpStatusCode.BadRequest,
+                        ActionResponse(
+                            success = false,
+                            message = "Failed to process batch request: ${e.message}",
+                            errorCode = ErrorCodes.SERVICE_ERROR
+                        )
+                    )
+                }
+            }
+            
             // 健康检查端点
             get("/health") {
                 debugLogger.logApiCall("GET", "/health")
@@ -446,6 +500,9 @@ class HttpServer(
                         <div class="endpoint">
                             <div class="method">GET</div> /device/info - 获取设备信息
                         </div>
+                        <div class="endpoint">
+                            <div class="method">POST</div> /batch - 批量执行操作
+                        </div>
                         <div class="endpoint">
                             <div class="method">GET</div> /health - 健康检查
                         </div>
@@ -467,6 +524,41 @@ class HttpServer(
         }
     }
     
+    /**
+     * 执行批量请求中的单个操作
+     * 单个操作失败不影响其余操作，失败结果以ActionResponse返回
+     */
+    private fun executeBatchOperation(op: BatchOperation): Any {
+        return try {
+            debugLogger.logUIOperation("BATCH", op.path, op.body?.toString())
+            when (op.path) {
+                "/ui/dump" -> uiAutomatorHelper.getPageSource()
+                "/ui/click" -> uiAutomatorHelper.clickElement(
+                    gson.fromJson(op.body, ClickRequest::class.java).selector
+                )
+                "/ui/input" -> uiAutomatorHelper.inputText(gson.fromJson(op.body, InputRequest::class.java))
+                "/ui/scroll" -> uiAutomatorHelper.scroll(gson.fromJson(op.body, ScrollRequest::class.java))
+                "/ui/wait" -> uiAutomatorHelper.waitForElement(gson.fromJson(op.body, WaitRequest::class.java))
+                "/device/back" -> uiAutomatorHelper.pressBack()
+                "/device/home" -> uiAutomatorHelper.pressHome()
+                "/device/recent" -> uiAutomatorHelper.pressRecentApps()
+                "/device/info" -> uiAutomatorHelper.getDeviceInfo()
+                else -> ActionResponse(
+                    success = false,
+                    message = "Unsupported batch operation: ${op.path}",
+                    errorCode = ErrorCodes.UNSUPPORTED_OPERATION
+                )
+            }
+        } catch (e: Exception) {
+            debugLogger.error("Batch operation ${op.path} failed", e)
+            ActionResponse(
+                success = false,
+                message = "Batch operation ${op.path} failed: ${e.message}",
+                errorCode = ErrorCodes.SERVICE_ERROR
+            )
+        }
+    }
+    
     /**
      * 将PageSource转换为XML格式
      */
@@ -6,93 +6,564 @@ This module provides an HTTP client to communicate with the Android UI Automator
 
 import asyncio
 import aiohttp
+import functools
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union, cast
 import json
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+from yarl import URL
+
+from selector import Selector, SelectorLike, encode_default
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional speedup
+    msgspec = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Bound methods used on the per-request path. Only the methods are cached, not
+# the enabled state, so level changes made after import (e.g. --debug) apply.
+_log_debug = logger.debug
+_debug_enabled = functools.partial(logger.isEnabledFor, logging.DEBUG)
+
+# Connection pool settings shared by every session created in this module.
+# The Android service is a single host, so the per-host limit is the one that
+# actually bounds concurrency; keep-alive is longer than aiohttp's 15s default
+# so idle gaps between UI operations don't force a new TCP handshake.
+CONNECTOR_LIMIT = 32
+CONNECTOR_LIMIT_PER_HOST = 8
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+
+# Chunk size used when streaming large response bodies
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Most operations coalesced into one /batch request
+MAX_BATCH_SIZE = 32
+
+# How long health/device-info results are reused, in seconds
+IDEMPOTENT_CACHE_TTL = 1.0
+
+# Longest the background warm-up request started by connect() may take
+WARM_UP_TIMEOUT = 2.0
+
+# Every endpoint exposed by the Android service
+ENDPOINTS = (
+    "/batch",
+    "/health",
+    "/ui/dump",
+    "/ui/dump/xml",
+    "/ui/click",
+    "/ui/input",
+    "/ui/scroll",
+    "/ui/wait",
+    "/device/back",
+    "/device/home",
+    "/device/recent",
+    "/device/info",
+)
+# Binary response format offered by the Android service. It is only requested
+# when msgspec is available to decode it; JSON stays the fallback.
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+ACCEPT_HEADER = (
+    f"{MSGPACK_CONTENT_TYPE}, application/json;q=0.5" if msgspec is not None
+    else "application/json"
+)
+
+# Request bodies are pre-encoded bytes, so the JSON content type is set per
+# request rather than relying on the session's default headers
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Endpoints whose successful responses are plain text rather than JSON
+TEXT_ENDPOINTS = frozenset({"/ui/dump/xml"})
+
+# Selectors are always encoded through encode_default (i.e. Selector.to_dict),
+# so unset fields are left out whichever encoder is installed
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = functools.partial(
+        orjson.dumps, default=encode_default, option=orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, default=encode_default).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_body(*items: Tuple[str, Any]) -> bytes:
+    """Encode a request body from hashable ``(key, value)`` pairs, memoized
+
+    Used for bodies built around a Selector, which scripts tend to reuse for
+    the same element many times.
+    """
+    return _dumps(dict(items))
+
+
+@functools.lru_cache(maxsize=32)
+def _decoder(msgpack_body: bool = False,
+             fields: Optional[Tuple[str, ...]] = None) -> Callable[[bytes], Dict[str, Any]]:
+    """Return a decoder for a response body.
+
+    msgpack bodies only arrive when msgspec is installed, since that is the
+    only case in which the client advertises them.
+
+    If ``fields`` is given, only those top-level fields are materialized. With
+    msgspec the payload is decoded into a struct holding just those fields, so
+    unrequested subtrees (usually the whole element tree) are skipped without
+    being turned into Python objects. Missing fields are None.
+    """
+    if msgspec is not None:
+        if fields is None:
+            return msgspec.msgpack.decode if msgpack_body else _loads
+        projection = msgspec.defstruct(
+            "UIDumpProjection", [(name, Any, None) for name in fields]
+        )
+        decoder: Union[msgspec.msgpack.Decoder, msgspec.json.Decoder]
+        if msgpack_body:
+            decoder = msgspec.msgpack.Decoder(projection)
+        else:
+            decoder = msgspec.json.Decoder(projection)
+        
+        def decode(raw: bytes) -> Dict[str, Any]:
+            return msgspec.structs.asdict(decoder.decode(raw))
+    else:
+        if fields is None:
+            return _loads
+        
+        def decode(raw: bytes) -> Dict[str, Any]:
+            result = _loads(raw)
+            return {name: result.get(name) for name in fields}
+    
+    return decode
+
+
+def _decode_error_body(raw: bytes, msgpack_body: bool, charset: Optional[str]) -> Dict[str, Any]:
+    """Decode an error response body, keeping non-JSON bodies as text"""
+    try:
+        return _decoder(msgpack_body)(raw)
+    except ValueError:
+        # Non-JSON error body, e.g. a plain-text 404 page
+        return {"content": raw.decode(charset or "utf-8", errors="replace")}
+
+
+def _finished_elements(parser: XMLPullParser, open_elements: List[Element],
+                       tag: str) -> Iterator[Element]:
+    """Yield the ``tag`` elements completed so far, releasing each afterwards
+
+    ``open_elements`` tracks the elements whose end tag has not been seen yet.
+    Once the consumer asks for the next element, the previous one is cleared
+    and detached from its parent so the parsed tree doesn't keep growing.
+    """
+    # Only start/end events are requested, so every item carries an Element
+    for event, element in cast(Iterator[Tuple[str, Element]], parser.read_events()):
+        if event == "start":
+            open_elements.append(element)
+            continue
+        open_elements.pop()
+        if element.tag != tag:
+            continue
+        yield element
+        if open_elements:
+            open_elements[-1].remove(element)
+        element.clear()
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create an aiohttp session with a tuned keep-alive connection pool.
+
+    Must be called from within a running event loop. One session is meant to
+    be shared for the lifetime of the application and may be passed to
+    several AndroidClient instances.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTOR_LIMIT,
+        limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30),
+        # UI dumps compress well; aiohttp decompresses responses transparently
+        headers={
+            "Content-Type": "application/json",
+            "Accept": ACCEPT_HEADER,
+            "Accept-Encoding": "gzip, deflate"
+        },
+        auto_decompress=True
+    )
+
+
 class AndroidClient:
     """HTTP client for Android UI Automator service"""
     
-    def __init__(self, host: str = "localhost", port: int = 8080):
+    def __init__(self, host: str = "localhost", port: int = 8080,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 cache_ttl: float = IDEMPOTENT_CACHE_TTL):
         self.host = host
         self.port = port
-        self.base_url = f"http://{host}:{port}"
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.base_url = self._build_base_url(host, port)
+        self.session: Optional[aiohttp.ClientSession] = session
+        # Only close sessions we created; an injected session belongs to the caller
+        self._owns_session = session is None
+        # Pre-parsed URLs so requests skip string building and URL parsing
+        self._urls: Dict[str, URL] = {
+            endpoint: URL(f"{self.base_url}{endpoint}", encoded=True)
+            for endpoint in ENDPOINTS
+        }
+        # Operations waiting to be coalesced into a single /batch request
+        self._batch_queue: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._batch_flush_task: Optional[asyncio.Task] = None
+        # Whether the service has a /batch endpoint; None until first used
+        self._batch_supported: Optional[bool] = None
+        # Short-lived cache and in-flight requests for idempotent GETs
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Background health check started by connect()
+        self._warm_up_task: Optional[asyncio.Task] = None
         
         logger.info(f"AndroidClient initialized for {self.base_url}")
     
+    @staticmethod
+    def _build_base_url(host: str, port: int) -> str:
+        """Build the service base URL without creating a client"""
+        return f"http://{host}:{port}"
+    
+    async def connect(self, session: Optional[aiohttp.ClientSession] = None,
+                      warm_up: bool = True) -> "AndroidClient":
+        """Create the HTTP session ahead of the first request
+
+        A ``session`` passed here is used instead, and stays owned by the
+        caller. With ``warm_up`` a health check is started in the background so
+        a keep-alive connection is usually pooled before the first real call.
+        connect() does not wait for it, and an unreachable device only costs
+        the warm-up request itself, which gives up after ``WARM_UP_TIMEOUT``.
+        """
+        if session is not None:
+            self.session = session
+            self._owns_session = False
+        elif self.session is None:
+            self.session = create_session()
+            self._owns_session = True
+        if warm_up and self._warm_up_task is None:
+            self._warm_up_task = asyncio.create_task(self._warm_up())
+        return self
+    
+    async def _warm_up(self) -> None:
+        """Open a pooled connection with a health check, ignoring failures
+
+        The request bypasses the health cache, so the timeout cancels it
+        instead of leaving a slow request for the next health_check() to join.
+        """
+        try:
+            await asyncio.wait_for(self._make_request("GET", "/health"), WARM_UP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.debug("Connection warm-up timed out")
+        finally:
+            self._warm_up_task = None
+    
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={"Content-Type": "application/json"}
+        """Get the HTTP session set up by connect() or passed to __init__"""
+        if self.session is None:
+            raise RuntimeError(
+                "AndroidClient is not connected; call connect() or use 'async with'"
             )
         return self.session
     
     async def close(self):
         """Close the HTTP session"""
-        if self.session and not self.session.closed:
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
     
-    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make HTTP request to Android service"""
-        url = f"{self.base_url}{endpoint}"
-        session = await self._get_session()
+    async def __aenter__(self) -> "AndroidClient":
+        return await self.connect()
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Union[Dict, bytes]] = None,
+                            fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Make HTTP request to Android service
+
+        ``data`` may be an already encoded JSON body. ``fields`` limits
+        decoding of a successful response to those top-level keys; error
+        responses are always decoded in full. Calling this before connect()
+        returns an error result like any other failure.
+        """
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = URL(f"{self.base_url}{endpoint}", encoded=True)
         
         try:
-            logger.debug(f"{method} {url} with data: {data}")
+            session = await self._get_session()
             
-            async with session.request(method, url, json=data) as response:
-                if response.content_type == 'application/json':
-                    result = await response.json()
+            # Payloads can be large UI dumps; only format them when debug is on
+            if _debug_enabled():
+                _log_debug("%s %s with data: %r", method, url, data)
+            
+            if method == "GET":
+                request = session.get(url)
+            else:
+                if data is None or isinstance(data, bytes):
+                    body = data
+                else:
+                    body = _dumps(data)
+                request = session.post(url, data=body, headers=JSON_HEADERS)
+            
+            async with request as response:
+                # The endpoint decides between text and structured bodies;
+                # Content-Type says whether the service answered in msgpack
+                # or JSON, since both may be negotiated through Accept
+                raw = await response.read()
+                msgpack_body = response.content_type == MSGPACK_CONTENT_TYPE
+                result: Dict[str, Any]
+                if endpoint in TEXT_ENDPOINTS and response.status < 400:
+                    result = {"content": raw.decode(response.charset or "utf-8")}
+                elif response.status < 400:
+                    result = _decoder(msgpack_body, fields)(raw)
                 else:
-                    # Handle text responses
-                    text = await response.text()
-                    result = {"content": text}
+                    result = _decode_error_body(raw, msgpack_body, response.charset)
                 
-                logger.debug(f"Response: {result}")
+                if _debug_enabled():
+                    _log_debug("Response: %r", result)
                 
                 if response.status >= 400:
-                    logger.error(f"HTTP {response.status}: {result}")
+                    logger.error("HTTP %s: %s", response.status, result)
                     result["http_status"] = response.status
                 
                 return result
                 
         except aiohttp.ClientError as e:
-            logger.error(f"HTTP client error: {e}")
+            logger.error("HTTP client error: %s", e)
             return {
                 "success": False,
                 "error": f"HTTP client error: {str(e)}",
                 "error_type": "client_error"
             }
         except Exception as e:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
+            logger.error("Unexpected error: %s", e, exc_info=True)
             return {
                 "success": False,
                 "error": f"Unexpected error: {str(e)}",
                 "error_type": "unknown_error"
             }
     
+    async def _cached_get(self, endpoint: str) -> Dict[str, Any]:
+        """GET an idempotent endpoint through the TTL cache
+
+        Concurrent callers share a single in-flight request. Error results are
+        returned but not cached. Each caller gets its own shallow copy.
+        """
+        cached = self._cache.get(endpoint)
+        if cached is not None and cached[0] > time.monotonic():
+            return dict(cached[1])
+        
+        task = self._inflight.get(endpoint)
+        if task is None:
+            task = asyncio.ensure_future(self._make_request("GET", endpoint))
+            self._inflight[endpoint] = task
+            task.add_done_callback(lambda t: self._store_cached(endpoint, t))
+        # Shield so one caller being cancelled doesn't cancel the shared request
+        return dict(await asyncio.shield(task))
+    
+    def _store_cached(self, endpoint: str, task: asyncio.Future):
+        """Done callback for _cached_get: cache successful results"""
+        self._inflight.pop(endpoint, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if "http_status" not in result and "error_type" not in result:
+            self._cache[endpoint] = (time.monotonic() + self._cache_ttl, result)
+    
+    async def gather(self, *aws: Awaitable[Any], limit: int = CONNECTOR_LIMIT_PER_HOST) -> List[Any]:
+        """Run independent requests concurrently, at most ``limit`` at a time
+
+        Results are returned in argument order, as with ``asyncio.gather``::
+
+            info, dump = await client.gather(client.get_device_info(), client.get_ui_dump())
+
+        The default limit matches the connector's per-host limit, so requests
+        beyond it would only queue for a pooled connection anyway.
+        """
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def run(aw: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await aw
+        
+        return list(await asyncio.gather(*(run(aw) for aw in aws)))
+    
+    async def batch(self, ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute several operations in a single round-trip
+
+        Each op is ``{"path": "/ui/click", "body": {...}}`` where ``path`` is the
+        endpoint the op would normally be sent to. Results are returned in the
+        same order as ``ops``. If the batch request itself fails, every op gets
+        a copy of the error result.
+
+        A single op is sent straight to its endpoint. Service builds without
+        /batch (it answers 404) are detected once; after that the ops are sent
+        to their own endpoints one after another, in order.
+        """
+        if len(ops) > 1 and self._batch_supported is not False:
+            result = await self._make_request("POST", "/batch", {"ops": ops})
+            if result.get("http_status") != 404:
+                self._batch_supported = True
+                results = result.get("results")
+                if not isinstance(results, list) or len(results) != len(ops):
+                    return [dict(result) for _ in ops]
+                return results
+            logger.info("Android service has no /batch endpoint; sending operations one by one")
+            self._batch_supported = False
+        
+        return [await self._make_request("POST", op["path"], op.get("body")) for op in ops]
+    
+    async def submit(self, path: str, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Queue an operation and wait for its result
+
+        An operation submitted while the queue is idle is sent right away.
+        Operations submitted while a request is in flight, or in the same
+        event loop iteration, are sent together in one /batch request (up to
+        ``MAX_BATCH_SIZE`` per request), so bursts of UI calls cost one
+        round-trip instead of many.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._batch_queue.append(({"path": path, "body": body}, future))
+        if self._batch_flush_task is None:
+            self._batch_flush_task = asyncio.create_task(self._flush_batch_queue())
+        return await future
+    
+    async def flush(self):
+        """Wait until every operation queued with submit() has completed
+
+        Call before a request that must observe the effect of queued ones.
+        """
+        while self._batch_flush_task is not None:
+            await asyncio.shield(self._batch_flush_task)
+    
+    async def _flush_batch_queue(self):
+        """Drain the batch queue, coalescing ops queued during each request"""
+        try:
+            while self._batch_queue:
+                pending = self._batch_queue[:MAX_BATCH_SIZE]
+                del self._batch_queue[:MAX_BATCH_SIZE]
+                try:
+                    results = await self.batch([op for op, _ in pending])
+                except BaseException as e:
+                    for _, future in pending:
+                        if not future.done():
+                            future.set_exception(e)
+                    # The waiting submit() calls have the error; keep draining
+                    # unless the flush itself was cancelled
+                    if not isinstance(e, Exception):
+                        raise
+                    continue
+                for (_, future), result in zip(pending, results):
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._batch_flush_task = None
+    
     async def health_check(self) -> Dict[str, Any]:
-        """Check if Android service is healthy"""
-        return await self._make_request("GET", "/health")
+        """Check if Android service is healthy (cached for ``cache_ttl`` seconds)"""
+        return await self._cached_get("/health")
     
-    async def get_ui_dump(self) -> Dict[str, Any]:
-        """Get current UI hierarchy"""
-        return await self._make_request("GET", "/ui/dump")
+    async def get_ui_dump(self, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Get current UI hierarchy
+
+        If ``fields`` is given, only those top-level keys (e.g. ``package_name``,
+        ``activity``) are decoded and returned.
+        """
+        if fields is None:
+            return await self._make_request("GET", "/ui/dump")
+        return await self._make_request("GET", "/ui/dump", fields=tuple(fields))
     
     async def get_ui_dump_xml(self) -> Dict[str, Any]:
-        """Get current UI hierarchy in XML format"""
+        """Get current UI hierarchy in XML format
+
+        The whole document is returned as text in ``content``; use
+        iter_ui_dump_xml() to process large dumps without buffering them.
+        """
         return await self._make_request("GET", "/ui/dump/xml")
     
-    async def click_element(self, selector: Dict[str, Any]) -> Dict[str, Any]:
+    async def iter_ui_dump_xml(self, tag: str = "element") -> AsyncIterator[Union[Element, Dict[str, Any]]]:
+        """Stream the XML UI hierarchy, yielding each ``tag`` element once parsed
+
+        The body is fed to an incremental parser chunk by chunk, so elements are
+        available before the whole dump has arrived and the XML text is never
+        held as a single string. Elements are yielded in document order of their
+        closing tags, i.e. children before their parent.
+
+        Each element is only valid until the next one is requested: it is then
+        cleared and removed from the tree, which keeps memory flat on large
+        dumps. Copy anything needed beyond that point. Since nested ``tag``
+        elements are yielded (and released) first, a parent only keeps its
+        other children.
+
+        On failure a single error dict, shaped like the other methods' error
+        results, is yielded instead and iteration stops. Unlike the other
+        methods, iterating before connect() raises RuntimeError.
+        """
+        session = await self._get_session()
+        parser: "XMLPullParser[Element]" = XMLPullParser(events=("start", "end"))
+        open_elements: List[Element] = []
+        
+        try:
+            async with session.get(self._urls["/ui/dump/xml"]) as response:
+                if response.status >= 400:
+                    raw = await response.read()
+                    msgpack_body = response.content_type == MSGPACK_CONTENT_TYPE
+                    result = _decode_error_body(raw, msgpack_body, response.charset)
+                    logger.error("HTTP %s: %s", response.status, result)
+                    result["http_status"] = response.status
+                    yield result
+                    return
+                
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    for element in _finished_elements(parser, open_elements, tag):
+                        yield element
+            
+            parser.close()
+            for element in _finished_elements(parser, open_elements, tag):
+                yield element
+                
+        except aiohttp.ClientError as e:
+            logger.error("HTTP client error: %s", e)
+            yield {
+                "success": False,
+                "error": f"HTTP client error: {str(e)}",
+                "error_type": "client_error"
+            }
+        except ParseError as e:
+            logger.error("Invalid UI dump XML: %s", e)
+            yield {
+                "success": False,
+                "error": f"Invalid UI dump XML: {str(e)}",
+                "error_type": "parse_error"
+            }
+    
+    async def click_element(self, selector: SelectorLike) -> Dict[str, Any]:
         """Click an element using selector"""
+        if isinstance(selector, Selector):
+            return await self._make_request("POST", "/ui/click", _encode_body(("selector", selector)))
         return await self._make_request("POST", "/ui/click", {"selector": selector})
     
-    async def input_text(self, selector: Dict[str, Any], text: str, clear_first: bool = True) -> Dict[str, Any]:
+    async def input_text(self, selector: SelectorLike, text: str, clear_first: bool = True) -> Dict[str, Any]:
         """Input text into an element"""
         data = {
             "selector": selector,
@@ -101,7 +572,7 @@ class AndroidClient:
         }
         return await self._make_request("POST", "/ui/input", data)
     
-    async def scroll(self, direction: str, steps: int = 1, selector: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def scroll(self, direction: str, steps: int = 1, selector: Optional[SelectorLike] = None) -> Dict[str, Any]:
         """Scroll the screen or a specific element"""
         data = {
             "direction": direction,
@@ -112,8 +583,11 @@ class AndroidClient:
         
         return await self._make_request("POST", "/ui/scroll", data)
     
-    async def wait_for_element(self, selector: Dict[str, Any], timeout: int = 5000, condition: str = "visible") -> Dict[str, Any]:
+    async def wait_for_element(self, selector: SelectorLike, timeout: int = 5000, condition: str = "visible") -> Dict[str, Any]:
         """Wait for an element to meet a condition"""
+        if isinstance(selector, Selector):
+            body = _encode_body(("selector", selector), ("timeout", timeout), ("condition", condition))
+            return await self._make_request("POST", "/ui/wait", body)
         data = {
             "selector": selector,
             "timeout": timeout,
@@ -134,16 +608,5 @@ class AndroidClient:
         return await self._make_request("POST", "/device/recent")
     
     async def get_device_info(self) -> Dict[str, Any]:
-        """Get device information"""
-        return await self._make_request("GET", "/device/info")
-    
-    def __del__(self):
-        """Cleanup when object is destroyed"""
-        if self.session and not self.session.closed:
-            # Try to schedule cleanup, but don't fail if event loop is already closed
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.close())
-            except RuntimeError:
-                pass  # Event loop is already closed
+        """Get device information (cached for ``cache_ttl`` seconds)"""
+        return await self._cached_get("/device/info")
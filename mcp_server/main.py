@@ -7,33 +7,45 @@ It communicates with an Android device running the UI Automator HTTP service.
 """
 
 import asyncio
-import json
 import sys
-from typing import Optional
 import argparse
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-from mcp import ClientSession, StdioServerParameters
-from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
 from server import UIAutomatorMCPServer
 
-# Configure logging
-import os
-log_file = os.path.join(os.path.dirname(__file__), 'mcp-ui-automator.log')
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
+logger = logging.getLogger(__name__)
+
+def setup_logging() -> QueueListener:
+    """Configure logging and start the listener that writes the records
+
+    Records are only enqueued on the event loop thread; file and stderr writes
+    happen on the QueueListener's background thread. The caller must stop the
+    returned listener on shutdown to flush queued records.
+    """
+    log_file = os.path.join(os.path.dirname(__file__), 'mcp-ui-automator.log')
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    log_handlers = [
         logging.FileHandler(log_file),
         logging.StreamHandler(sys.stderr)
     ]
-)
-logger = logging.getLogger(__name__)
+    for log_handler in log_handlers:
+        log_handler.setFormatter(log_formatter)
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # The listener's handlers apply the real format; avoid formatting twice
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    log_listener = QueueListener(log_queue, *log_handlers)
+    log_listener.start()
+    return log_listener
 
-async def main():
-    """Main entry point for the MCP server"""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(description='Android UI Automator MCP Server')
     parser.add_argument(
         '--android-host', 
@@ -57,6 +69,11 @@ async def main():
         action='store_true',
         help='Enable debug logging'
     )
+    return parser
+
+async def main():
+    """Main entry point for the MCP server"""
+    parser = build_parser()
     
     # Parse arguments or use stdio by default
     if len(sys.argv) == 1:
@@ -82,9 +99,10 @@ async def main():
         if args.stdio:
             logger.info("Starting MCP server with stdio transport...")
             
-            # Run the stdio server
-            async with stdio_server() as (read_stream, write_stream):
-                await mcp_server.run_stdio(read_stream, write_stream)
+            # Connect the Android client up front and close it on shutdown
+            async with mcp_server:
+                async with stdio_server() as (read_stream, write_stream):
+                    await mcp_server.run_stdio(read_stream, write_stream)
         else:
             logger.error("Only stdio transport is currently supported")
             sys.exit(1)
@@ -95,5 +113,22 @@ async def main():
         logger.error(f"Server error: {e}", exc_info=True)
         sys.exit(1)
 
+def install_event_loop_policy():
+    """Use uvloop for the asyncio event loop when it is available"""
+    if sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    log_listener = setup_logging()
+    install_event_loop_policy()
+    try:
+        asyncio.run(main())
+    finally:
+        # Flush queued records before the process exits
+        log_listener.stop()
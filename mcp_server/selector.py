@@ -0,0 +1,63 @@
+"""
+Element Selector
+
+Typed element selector matching the Android service's ElementSelector model.
+"""
+
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from typing import Any, Dict, Optional, Union
+
+
+@dataclass(frozen=True)
+class Bounds:
+    """Element bounds coordinates"""
+    left: int = 0
+    top: int = 0
+    right: int = 0
+    bottom: int = 0
+
+
+_BOUNDS_FIELDS = tuple(f.name for f in fields(Bounds))
+
+
+@dataclass(frozen=True)
+class Selector:
+    """Element selector, at least one field should be set
+
+    Selectors are immutable and hashable, so the same selector can be reused
+    across calls and used as a cache key.
+    """
+    resource_id: Optional[str] = None
+    text: Optional[str] = None
+    text_contains: Optional[str] = None
+    class_name: Optional[str] = None
+    content_desc: Optional[str] = None
+    index: Optional[int] = None
+    bounds: Optional[Bounds] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Selector":
+        """Build a selector from a plain dict such as MCP tool arguments"""
+        values = {f.name: data.get(f.name) for f in fields(cls)}
+        bounds = values["bounds"]
+        if isinstance(bounds, dict):
+            # Ignore keys Bounds doesn't know; the tool schema allows extras
+            values["bounds"] = Bounds(**{k: bounds[k] for k in _BOUNDS_FIELDS if k in bounds})
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the selector as a dict without unset fields"""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+# Selectors may be passed either typed or as plain dicts
+SelectorLike = Union[Selector, Dict[str, Any]]
+
+
+def encode_default(obj: Any) -> Any:
+    """``default`` hook letting the stdlib json module encode selectors"""
+    if isinstance(obj, Selector):
+        return obj.to_dict()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
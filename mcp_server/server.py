@@ -4,359 +4,566 @@ Android UI Automator MCP Server Implementation
 Provides MCP tools for Android UI automation through a standard MCP interface.
 """
 
-import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Sequence
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Final, FrozenSet, List, Optional, Tuple
 import json
 
 import mcp.types as types
 from mcp.server import Server
-from mcp.server.models import InitializationOptions
-from mcp import ClientSession
 from pydantic import AnyUrl
 
-from android_client import AndroidClient
+import aiohttp
+
+from android_client import AndroidClient, create_session
+from selector import Selector
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import fastjsonschema  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - argument validation is optional
+    fastjsonschema = None
+
+if TYPE_CHECKING:
+    from mcp.server.models import InitializationOptions
 
 logger = logging.getLogger(__name__)
 
+# UI dumps whose serialized size exceeds this many characters are returned as
+# several TextContent chunks (one per top-level subtree) instead of one string
+UI_DUMP_CHUNK_THRESHOLD: Final = 256 * 1024
+
+# How long a fetched UI dump is reused by the tool and resource, in seconds
+UI_DUMP_CACHE_TTL: Final = 0.2
+
+# Tools that leave the device UI unchanged; any other tool invalidates the cache
+READ_ONLY_TOOLS: Final[FrozenSet[str]] = frozenset({"get_ui_dump", "get_device_info"})
+
+# Element selector fields, shared by every tool schema that targets an element
+_SELECTOR_PROPERTIES: Final[Dict[str, Any]] = {
+    "resource_id": {
+        "type": "string",
+        "description": "Android resource ID (e.g., 'com.example:id/button')"
+    },
+    "text": {
+        "type": "string",
+        "description": "Exact text content to match"
+    },
+    "text_contains": {
+        "type": "string",
+        "description": "Partial text content to match"
+    },
+    "class_name": {
+        "type": "string",
+        "description": "UI element class name (e.g., 'android.widget.Button')"
+    },
+    "content_desc": {
+        "type": "string",
+        "description": "Content description for accessibility"
+    }
+}
+
+_BOUNDS_SCHEMA: Final[Dict[str, Any]] = {
+    "type": "object",
+    "description": "Element bounds coordinates",
+    "properties": {
+        "left": {"type": "integer"},
+        "top": {"type": "integer"},
+        "right": {"type": "integer"},
+        "bottom": {"type": "integer"}
+    }
+}
+
+# Tools sent through the client's batch queue, so back-to-back calls share one
+# /batch request. Every other tool first waits for queued ones to finish.
+BATCHED_TOOLS: Final[FrozenSet[str]] = frozenset({"press_back", "press_home", "press_recent", "scroll_screen"})
+
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[List[types.TextContent]]]
+ResourceHandler = Callable[[], Awaitable[str]]
+
+# Stdlib fallback encoders, built once instead of per json.dumps call
+_COMPACT_ENCODER: Final = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_PRETTY_ENCODER: Final = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize a tool/resource result to JSON text
+
+    Results are read by the MCP client, not people, so they are compact by
+    default; indented output is meant for debug logs.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    return (_PRETTY_ENCODER if indent else _COMPACT_ENCODER).encode(obj)
+
+
+def _error_json(error: str, error_type: str) -> str:
+    """Serialize an error result; only the two strings go through the encoder"""
+    return '{"success":false,"error":%s,"error_type":%s}' % (_dumps(error), _dumps(error_type))
+
+
+def _text_contents(result: Dict[str, Any]) -> List[types.TextContent]:
+    """Wrap a result as a single TextContent"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Tool result:\n%s", _dumps(result, indent=True))
+    return [types.TextContent(type="text", text=_dumps(result))]
+
+
+def _returning_text(call: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]) -> ToolHandler:
+    """Adapt a client call returning a dict into a tool handler"""
+    async def handler(arguments: Dict[str, Any]) -> List[types.TextContent]:
+        return _text_contents(await call(arguments))
+    return handler
+
+
+# Selector fields accepted by the click_element tool, in a fixed order
+_SELECTOR_KEYS: Final = ("resource_id", "text", "text_contains", "class_name", "content_desc", "bounds")
+
+
+@lru_cache(maxsize=512)
+def _cached_selector(values: Tuple[Any, ...]) -> Selector:
+    """Build a Selector from values ordered like _SELECTOR_KEYS"""
+    return Selector.from_dict(dict(zip(_SELECTOR_KEYS, values)))
+
+
+def _selector_from_arguments(arguments: Dict[str, Any]) -> Selector:
+    """Build the click selector, memoized since scripts click the same element repeatedly
+
+    Only the known selector keys are read, so the cache key is a fixed-length
+    tuple and unrelated arguments are ignored. A cached Selector also lets the
+    client reuse its encoded request body.
+    """
+    get = arguments.get
+    values = (get("resource_id"), get("text"), get("text_contains"),
+              get("class_name"), get("content_desc"), get("bounds"))
+    try:
+        return _cached_selector(values)
+    except TypeError:
+        # Unhashable values such as a bounds dict
+        return Selector.from_dict(dict(zip(_SELECTOR_KEYS, values)))
+
+
+def _ui_dump_contents(result: Dict[str, Any]) -> Tuple[List[types.TextContent], Optional[str]]:
+    """Serialize a UI dump, splitting large trees into one chunk per top-level child
+
+    The dump is serialized once; only when that text reaches the threshold is
+    it split. The first chunk then holds the dump metadata and the root
+    element without its children, and each following chunk is one serialized
+    child subtree. Returns the tool contents and, when the dump was sent as a
+    single chunk, its serialized text.
+    """
+    text = _dumps(result)
+    root = result.get("root")
+    children = root.get("children") if isinstance(root, dict) else None
+    if len(text) < UI_DUMP_CHUNK_THRESHOLD or not isinstance(root, dict) or not children:
+        return [types.TextContent(type="text", text=text)], text
+    
+    # The full text is not returned, so a cached large dump only holds its chunks
+    header = {k: v for k, v in result.items() if k != "root"}
+    header["root"] = {k: v for k, v in root.items() if k != "children"}
+    chunks = [_dumps(header)] + [_dumps(child) for child in children]
+    return [types.TextContent(type="text", text=chunk) for chunk in chunks], None
+
+
 class UIAutomatorMCPServer:
     """MCP Server for Android UI Automation"""
     
     def __init__(self, android_host: str = "localhost", android_port: int = 8080):
-        self.android_host = android_host
-        self.android_port = android_port
-        self.android_client = AndroidClient(android_host, android_port)
+        self.android_host: str = android_host
+        self.android_port: int = android_port
+        self.android_client: AndroidClient = AndroidClient(android_host, android_port)
+        # Long-lived HTTP session shared by every tool call, created in start()
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Tool and resource definitions are static; build them once
+        self._tools: List[types.Tool] = self._build_tools()
+        self._resources: List[types.Resource] = self._build_resources()
+        # Validators are generated code, compiled once per tool schema
+        self._validators: Dict[str, Any] = {}
+        if fastjsonschema is not None:
+            self._validators = {
+                tool.name: fastjsonschema.compile(tool.inputSchema) for tool in self._tools
+            }
+        
+        # Tool name -> adapter calling the Android client with that tool's arguments
+        self._dispatch: Dict[str, ToolHandler] = self._build_dispatch()
+        # Resource URI -> coroutine returning the resource text
+        self._resource_handlers: Dict[str, ResourceHandler] = {
+            "android://ui/current": self._ui_dump_resource,
+            "android://device/info": self._device_info_resource,
+        }
+        # Recent UI dump as (fetched_at, result, tool contents, serialized text).
+        # The text is only kept for dumps small enough to be sent as one chunk.
+        self._ui_dump_cache: Optional[
+            Tuple[float, Dict[str, Any], List[types.TextContent], Optional[str]]
+        ] = None
+        self._ui_dump_cache_ttl: float = UI_DUMP_CACHE_TTL
+        # Bumped whenever the cache is invalidated, so a fetch that overlapped
+        # an action doesn't store the pre-action screen
+        self._ui_dump_generation: int = 0
         
         # Initialize MCP server
-        self.server = Server("android-ui-automator")
+        self.server: Server = Server("android-ui-automator")
         self._setup_handlers()
+        # Built on first run and reused by later runs
+        self._init_options: Optional["InitializationOptions"] = None
         
         logger.info(f"UIAutomatorMCPServer initialized for {android_host}:{android_port}")
     
-    def _setup_handlers(self):
-        """Setup MCP server handlers"""
-        
-        @self.server.list_tools()
-        async def handle_list_tools() -> List[types.Tool]:
-            """List available UI automation tools"""
-            return [
-                types.Tool(
-                    name="get_ui_dump",
-                    description="Get the current UI hierarchy/tree from Android device",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
+    async def start(self) -> None:
+        """Create the shared HTTP session and connect the Android client"""
+        if self._session is None or self._session.closed:
+            self._session = create_session()
+            await self.android_client.connect(session=self._session)
+    
+    async def close(self) -> None:
+        """Release the Android client's HTTP resources"""
+        await self.android_client.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    async def __aenter__(self) -> "UIAutomatorMCPServer":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        await self.close()
+    
+    def _build_tools(self) -> List[types.Tool]:
+        """Build the list of UI automation tools"""
+        return [
+            types.Tool(
+                name="get_ui_dump",
+                description=(
+                    "Get the current UI hierarchy/tree from Android device. Large "
+                    "dumps come back as several text items: the first holds the "
+                    "dump metadata and the root element without its children, "
+                    "each following item one child subtree. No item is the "
+                    "complete dump JSON on its own."
                 ),
-                types.Tool(
-                    name="click_element",
-                    description="Click an element on the Android screen",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "resource_id": {
-                                "type": "string",
-                                "description": "Android resource ID (e.g., 'com.example:id/button')"
-                            },
-                            "text": {
-                                "type": "string",
-                                "description": "Exact text content to match"
-                            },
-                            "text_contains": {
-                                "type": "string", 
-                                "description": "Partial text content to match"
-                            },
-                            "class_name": {
-                                "type": "string",
-                                "description": "UI element class name (e.g., 'android.widget.Button')"
-                            },
-                            "content_desc": {
-                                "type": "string",
-                                "description": "Content description for accessibility"
-                            },
-                            "bounds": {
-                                "type": "object",
-                                "description": "Element bounds coordinates",
-                                "properties": {
-                                    "left": {"type": "integer"},
-                                    "top": {"type": "integer"},
-                                    "right": {"type": "integer"},
-                                    "bottom": {"type": "integer"}
-                                }
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            types.Tool(
+                name="click_element",
+                description="Click an element on the Android screen",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        **_SELECTOR_PROPERTIES,
+                        "bounds": _BOUNDS_SCHEMA
+                    },
+                    "anyOf": [
+                        {"required": ["resource_id"]},
+                        {"required": ["text"]},
+                        {"required": ["text_contains"]},
+                        {"required": ["class_name"]},
+                        {"required": ["content_desc"]},
+                        {"required": ["bounds"]}
+                    ]
+                }
+            ),
+            types.Tool(
+                name="input_text",
+                description="Input text into a text field on Android device",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "text": {
+                            "type": "string",
+                            "description": "Text to input"
                         },
-                        "anyOf": [
-                            {"required": ["resource_id"]},
-                            {"required": ["text"]},
-                            {"required": ["text_contains"]},
-                            {"required": ["class_name"]},
-                            {"required": ["content_desc"]},
-                            {"required": ["bounds"]}
-                        ]
-                    }
-                ),
-                types.Tool(
-                    name="input_text",
-                    description="Input text into a text field on Android device",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "text": {
-                                "type": "string",
-                                "description": "Text to input"
-                            },
-                            "clear_first": {
-                                "type": "boolean",
-                                "description": "Whether to clear existing text first",
-                                "default": True
-                            },
-                            "selector": {
-                                "type": "object",
-                                "description": "Element selector for the input field",
-                                "properties": {
-                                    "resource_id": {"type": "string"},
-                                    "text": {"type": "string"},
-                                    "text_contains": {"type": "string"},
-                                    "class_name": {"type": "string"},
-                                    "content_desc": {"type": "string"}
-                                }
-                            }
+                        "clear_first": {
+                            "type": "boolean",
+                            "description": "Whether to clear existing text first",
+                            "default": True
                         },
-                        "required": ["text", "selector"]
-                    }
-                ),
-                types.Tool(
-                    name="scroll_screen",
-                    description="Scroll the screen in a specified direction",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "direction": {
-                                "type": "string",
-                                "enum": ["up", "down", "left", "right"],
-                                "description": "Direction to scroll"
-                            },
-                            "steps": {
-                                "type": "integer",
-                                "description": "Number of scroll steps",
-                                "default": 1,
-                                "minimum": 1,
-                                "maximum": 10
-                            }
+                        "selector": {
+                            "type": "object",
+                            "description": "Element selector for the input field",
+                            "properties": _SELECTOR_PROPERTIES
+                        }
+                    },
+                    "required": ["text", "selector"]
+                }
+            ),
+            types.Tool(
+                name="scroll_screen",
+                description="Scroll the screen in a specified direction",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "direction": {
+                            "type": "string",
+                            "enum": ["up", "down", "left", "right"],
+                            "description": "Direction to scroll"
                         },
-                        "required": ["direction"]
-                    }
-                ),
-                types.Tool(
-                    name="wait_for_element",
-                    description="Wait for an element to appear or disappear",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "timeout": {
-                                "type": "integer",
-                                "description": "Timeout in milliseconds",
-                                "default": 5000,
-                                "minimum": 1000,
-                                "maximum": 30000
-                            },
-                            "condition": {
-                                "type": "string",
-                                "enum": ["visible", "gone", "clickable"],
-                                "description": "Wait condition",
-                                "default": "visible"
-                            },
-                            "selector": {
-                                "type": "object",
-                                "description": "Element selector to wait for",
-                                "properties": {
-                                    "resource_id": {"type": "string"},
-                                    "text": {"type": "string"},
-                                    "text_contains": {"type": "string"},
-                                    "class_name": {"type": "string"},
-                                    "content_desc": {"type": "string"}
-                                }
-                            }
+                        "steps": {
+                            "type": "integer",
+                            "description": "Number of scroll steps",
+                            "default": 1,
+                            "minimum": 1,
+                            "maximum": 10
+                        }
+                    },
+                    "required": ["direction"]
+                }
+            ),
+            types.Tool(
+                name="wait_for_element",
+                description="Wait for an element to appear or disappear",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "timeout": {
+                            "type": "integer",
+                            "description": "Timeout in milliseconds",
+                            "default": 5000,
+                            "minimum": 1000,
+                            "maximum": 30000
                         },
-                        "required": ["selector"]
-                    }
-                ),
-                types.Tool(
-                    name="press_back",
-                    description="Press the Android back button",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="press_home",
-                    description="Press the Android home button",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="press_recent",
-                    description="Press the Android recent apps button",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                types.Tool(
-                    name="get_device_info",
-                    description="Get Android device information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                )
-            ]
+                        "condition": {
+                            "type": "string",
+                            "enum": ["visible", "gone", "clickable"],
+                            "description": "Wait condition",
+                            "default": "visible"
+                        },
+                        "selector": {
+                            "type": "object",
+                            "description": "Element selector to wait for",
+                            "properties": _SELECTOR_PROPERTIES
+                        }
+                    },
+                    "required": ["selector"]
+                }
+            ),
+            types.Tool(
+                name="press_back",
+                description="Press the Android back button",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            types.Tool(
+                name="press_home",
+                description="Press the Android home button",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            types.Tool(
+                name="press_recent",
+                description="Press the Android recent apps button",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            types.Tool(
+                name="get_device_info",
+                description="Get Android device information",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            )
+        ]
+    
+    def _build_resources(self) -> List[types.Resource]:
+        """Build the list of available resources"""
+        return [
+            types.Resource(
+                uri=AnyUrl("android://ui/current"),
+                name="Current UI State",
+                description="Current Android UI hierarchy and element information",
+                mimeType="application/json"
+            ),
+            types.Resource(
+                uri=AnyUrl("android://device/info"),
+                name="Device Information",
+                description="Android device specifications and status",
+                mimeType="application/json"
+            )
+        ]
+    
+    def _build_dispatch(self) -> Dict[str, ToolHandler]:
+        """Map each tool name to a call on the Android client"""
+        client = self.android_client
+        calls = {
+            "click_element": lambda args: client.click_element(_selector_from_arguments(args)),
+            "input_text": lambda args: client.input_text(
+                args["selector"], args["text"], args.get("clear_first", True)
+            ),
+            "scroll_screen": lambda args: client.submit(
+                "/ui/scroll", {"direction": args["direction"], "steps": args.get("steps", 1)}
+            ),
+            "wait_for_element": lambda args: client.wait_for_element(
+                args["selector"], args.get("timeout", 5000), args.get("condition", "visible")
+            ),
+            "press_back": lambda args: client.submit("/device/back"),
+            "press_home": lambda args: client.submit("/device/home"),
+            "press_recent": lambda args: client.submit("/device/recent"),
+            "get_device_info": lambda args: client.get_device_info(),
+        }
+        dispatch = {name: _returning_text(call) for name, call in calls.items()}
+        dispatch["get_ui_dump"] = self._ui_dump_tool
+        return dispatch
+    
+    async def _cached_ui_dump(self) -> Tuple[Dict[str, Any], List[types.TextContent], Optional[str]]:
+        """Get the UI dump as (result, tool contents, serialized text), reusing a recent one
+
+        The contents are built once per fetch and shared by the get_ui_dump
+        tool and the android://ui/current resource. The text is None for dumps
+        sent in chunks. Error results are not cached, and neither is a dump
+        fetched while the cache was invalidated.
+        """
+        now = time.monotonic()
+        cached = self._ui_dump_cache
+        if cached is not None and now - cached[0] < self._ui_dump_cache_ttl:
+            return cached[1], cached[2], cached[3]
         
-        @self.server.call_tool()
+        generation = self._ui_dump_generation
+        result = await self.android_client.get_ui_dump()
+        contents, text = _ui_dump_contents(result)
+        if ("error_type" not in result and "http_status" not in result
+                and generation == self._ui_dump_generation):
+            self._ui_dump_cache = (now, result, contents, text)
+        return result, contents, text
+    
+    def _invalidate_ui_dump(self) -> None:
+        """Drop the cached UI dump and any fetch still in flight"""
+        self._ui_dump_cache = None
+        self._ui_dump_generation += 1
+    
+    async def _ui_dump_tool(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """Handler for the get_ui_dump tool"""
+        _, contents, _ = await self._cached_ui_dump()
+        return contents
+    
+    async def _ui_dump_resource(self) -> str:
+        """Handler for the android://ui/current resource"""
+        result, _, text = await self._cached_ui_dump()
+        # Large dumps are only serialized as a whole when read as the resource
+        return text if text is not None else _dumps(result)
+    
+    async def _device_info_resource(self) -> str:
+        """Handler for the android://device/info resource"""
+        return _dumps(await self.android_client.get_device_info())
+    
+    def _call_tool_decorator(self) -> Callable[[Callable[..., Any]], Any]:
+        """Get the call_tool registration decorator
+
+        mcp validates arguments against the tool's inputSchema by default. When
+        the compiled validators are available that would validate every call
+        twice, so mcp's own validation is turned off.
+        """
+        if self._validators:
+            try:
+                return self.server.call_tool(validate_input=False)
+            except TypeError:
+                # Older mcp releases have no validate_input and don't validate
+                pass
+        return self.server.call_tool()
+    
+    def _setup_handlers(self) -> None:
+        """Setup MCP server handlers"""
+        
+        @self.server.list_tools()
+        async def handle_list_tools() -> List[types.Tool]:
+            """List available UI automation tools"""
+            return list(self._tools)
+        
+        @self._call_tool_decorator()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
             """Handle tool calls"""
-            logger.info(f"Tool called: {name} with args: {arguments}")
+            # Arguments can be large; only stringify them when the record is emitted
+            logger.info("Tool called: %s with args: %s", name, arguments)
             
-            try:
-                if name == "get_ui_dump":
-                    result = await self.android_client.get_ui_dump()
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2, ensure_ascii=False)
-                    )]
-                
-                elif name == "click_element":
-                    # Build selector from arguments
-                    selector = {k: v for k, v in arguments.items() if v is not None}
-                    result = await self.android_client.click_element(selector)
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "input_text":
-                    text = arguments["text"]
-                    selector = arguments["selector"]
-                    clear_first = arguments.get("clear_first", True)
-                    
-                    result = await self.android_client.input_text(selector, text, clear_first)
+            validator = self._validators.get(name)
+            if validator is not None:
+                try:
+                    # Also fills in schema defaults
+                    arguments = validator(arguments)
+                except fastjsonschema.JsonSchemaException as e:
+                    logger.warning("Invalid arguments for tool %s: %s", name, e.message)
                     return [types.TextContent(
                         type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "scroll_screen":
-                    direction = arguments["direction"]
-                    steps = arguments.get("steps", 1)
-                    
-                    result = await self.android_client.scroll(direction, steps)
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "wait_for_element":
-                    selector = arguments["selector"]
-                    timeout = arguments.get("timeout", 5000)
-                    condition = arguments.get("condition", "visible")
-                    
-                    result = await self.android_client.wait_for_element(selector, timeout, condition)
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps(result, indent=2)
+                        text=_error_json(f"Invalid arguments: {e.message}", "validation_error")
                     )]
-                
-                elif name == "press_back":
-                    result = await self.android_client.press_back()
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "press_home":
-                    result = await self.android_client.press_home()
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "press_recent":
-                    result = await self.android_client.press_recent()
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                elif name == "get_device_info":
-                    result = await self.android_client.get_device_info()
-                    return [types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2)
-                    )]
-                
-                else:
+            
+            try:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     raise ValueError(f"Unknown tool: {name}")
+                if name not in BATCHED_TOOLS:
+                    await self.android_client.flush()
+                
+                try:
+                    return await handler(arguments)
+                finally:
+                    # Actions may change the screen; the next dump must be fresh
+                    if name not in READ_ONLY_TOOLS:
+                        self._invalidate_ui_dump()
                     
             except Exception as e:
-                logger.error(f"Error executing tool {name}: {e}", exc_info=True)
+                logger.error("Error executing tool %s: %s", name, e, exc_info=True)
                 return [types.TextContent(
                     type="text",
-                    text=json.dumps({
-                        "success": False,
-                        "error": str(e),
-                        "error_type": type(e).__name__
-                    }, indent=2)
+                    text=_error_json(str(e), type(e).__name__)
                 )]
         
         @self.server.list_resources()
         async def handle_list_resources() -> List[types.Resource]:
             """List available resources"""
-            return [
-                types.Resource(
-                    uri=AnyUrl("android://ui/current"),
-                    name="Current UI State",
-                    description="Current Android UI hierarchy and element information",
-                    mimeType="application/json"
-                ),
-                types.Resource(
-                    uri=AnyUrl("android://device/info"),
-                    name="Device Information",
-                    description="Android device specifications and status",
-                    mimeType="application/json"
-                )
-            ]
+            return list(self._resources)
         
         @self.server.read_resource()
         async def handle_read_resource(uri: AnyUrl) -> str:
             """Handle resource reading"""
-            logger.info(f"Resource requested: {uri}")
-            
-            if str(uri) == "android://ui/current":
-                result = await self.android_client.get_ui_dump()
-                return json.dumps(result, indent=2, ensure_ascii=False)
-            
-            elif str(uri) == "android://device/info":
-                result = await self.android_client.get_device_info()
-                return json.dumps(result, indent=2)
-            
-            else:
+            logger.info("Resource requested: %s", uri)
+            handler = self._resource_handlers.get(str(uri))
+            if handler is None:
                 raise ValueError(f"Unknown resource: {uri}")
+            await self.android_client.flush()
+            return await handler()
     
-    async def run_stdio(self, read_stream, write_stream):
+    def _initialization_options(self) -> "InitializationOptions":
+        """Get the MCP initialization options, building them once"""
+        if self._init_options is None:
+            # Only needed once per process, when the server starts running
+            from mcp.server import NotificationOptions
+            from mcp.server.models import InitializationOptions
+            
+            self._init_options = InitializationOptions(
+                server_name="android-ui-automator",
+                server_version="1.0.0",
+                capabilities=self.server.get_capabilities(
+                    notification_options=NotificationOptions(),
+                    experimental_capabilities={}
+                )
+            )
+        return self._init_options
+    
+    async def run_stdio(self, read_stream: Any, write_stream: Any) -> None:
         """Run the MCP server with stdio transport"""
         logger.info("MCP server running with stdio transport")
+        await self.start()
         
-        async with ClientSession(read_stream, write_stream) as session:
-            # Initialize the session
-            await session.initialize()
-            
-            # Keep the server running
-            await session.run_server()
+        try:
+            await self.server.run(read_stream, write_stream, self._initialization_options())
+        finally:
+            await self.close()
@@ -0,0 +1,39 @@
+"""
+Packaging for the MCP server modules
+
+A plain build installs the pure Python modules. Setting MCP_SERVER_MYPYC=1
+compiles server.py into a C extension with mypyc. mypy must be installed in
+the build environment, hence no build isolation:
+
+    MCP_SERVER_MYPYC=1 pip install --no-build-isolation .
+
+The extension only ends up in the installed package, never next to the
+sources, so running ``python main.py`` from this directory stays pure Python.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("MCP_SERVER_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # mypyc also type checks android_client.py and selector.py, which
+    # server.py imports; the build fails if any of them does not check
+    ext_modules = mypycify(["server.py"])
+
+setup(
+    name="android-ui-automator-mcp",
+    version="1.0.0",
+    description="MCP server for Android UI automation",
+    py_modules=["main", "server", "android_client", "selector"],
+    ext_modules=ext_modules,
+    python_requires=">=3.8",
+    install_requires=[
+        "mcp>=0.8.0",
+        "pydantic>=2.0.0",
+        "aiohttp>=3.9.0",
+        "typing-extensions>=4.8.0",
+    ],
+)
@@ -0,0 +1,223 @@
+"""
+Tests for AndroidClient's batching of UI operations
+
+The HTTP layer is replaced by a scripted _make_request, so no device or
+service is needed. Run from this directory with
+``python -m unittest test_android_client`` (pytest collects it too).
+"""
+
+import asyncio
+import unittest
+from typing import Any, Dict, List, Optional, Tuple
+
+from android_client import AndroidClient
+
+
+class FakeTransport:
+    """Stand-in for AndroidClient._make_request that records every request
+
+    Replies are produced by ``respond(endpoint, data)``. While ``gate`` is
+    cleared, requests wait for it, which keeps a request in flight.
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.calls: List[Tuple[str, str, Any]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, method: str, endpoint: str, data: Optional[Any] = None,
+                       fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        self.calls.append((method, endpoint, data))
+        await self.gate.wait()
+        return self.respond(endpoint, data)
+
+    async def wait_for_calls(self, count: int) -> None:
+        """Let the event loop run until ``count`` requests have been made"""
+        for _ in range(100):
+            if len(self.calls) >= count:
+                return
+            await asyncio.sleep(0)
+        raise AssertionError(f"expected {count} requests, got {self.calls}")
+
+    @property
+    def endpoints(self) -> List[str]:
+        return [endpoint for _, endpoint, _ in self.calls]
+
+
+def batch_service(endpoint: str, data: Optional[Any]) -> Dict[str, Any]:
+    """Reply like a service with /batch, echoing each op's path"""
+    if endpoint == "/batch":
+        return {"success": True, "results": [{"success": True, "path": op["path"]} for op in data["ops"]]}
+    return {"success": True, "path": endpoint}
+
+
+def service_without_batch(endpoint: str, data: Optional[Any]) -> Dict[str, Any]:
+    """Reply like an older service build that has no /batch endpoint"""
+    if endpoint == "/batch":
+        return {"success": False, "error": "Not Found", "http_status": 404}
+    return {"success": True, "path": endpoint}
+
+
+OPS = [
+    {"path": "/device/back", "body": None},
+    {"path": "/ui/scroll", "body": {"direction": "down", "steps": 1}},
+]
+
+
+class BatchTest(unittest.IsolatedAsyncioTestCase):
+    """AndroidClient.batch()"""
+
+    def client(self, respond) -> Tuple[AndroidClient, FakeTransport]:
+        client = AndroidClient()
+        transport = FakeTransport(respond)
+        client._make_request = transport  # type: ignore[method-assign]
+        return client, transport
+
+    async def test_ops_are_sent_in_one_batch_request(self):
+        client, transport = self.client(batch_service)
+        results = await client.batch(OPS)
+
+        self.assertEqual(transport.endpoints, ["/batch"])
+        self.assertEqual(transport.calls[0][2], {"ops": OPS})
+        self.assertEqual([r["path"] for r in results], ["/device/back", "/ui/scroll"])
+
+    async def test_single_op_goes_to_its_endpoint(self):
+        client, transport = self.client(batch_service)
+        results = await client.batch(OPS[:1])
+
+        self.assertEqual(transport.endpoints, ["/device/back"])
+        self.assertEqual(results, [{"success": True, "path": "/device/back"}])
+
+    async def test_404_falls_back_to_direct_endpoints(self):
+        client, transport = self.client(service_without_batch)
+        results = await client.batch(OPS)
+
+        self.assertEqual(transport.endpoints, ["/batch", "/device/back", "/ui/scroll"])
+        self.assertEqual([r["path"] for r in results], ["/device/back", "/ui/scroll"])
+        self.assertIs(client._batch_supported, False)
+
+        # The missing endpoint is remembered; /batch is not tried again
+        transport.calls.clear()
+        await client.batch(OPS)
+        self.assertEqual(transport.endpoints, ["/device/back", "/ui/scroll"])
+
+    async def test_malformed_reply_is_copied_to_every_op(self):
+        for reply in (
+            {"success": True},
+            {"success": True, "results": "not a list"},
+            {"success": True, "results": [{"success": True}]},
+            {"success": False, "error": "boom", "error_type": "client_error"},
+        ):
+            with self.subTest(reply=reply):
+                client, transport = self.client(lambda endpoint, data: dict(reply))
+                results = await client.batch(OPS)
+
+                self.assertEqual(transport.endpoints, ["/batch"])
+                self.assertEqual(results, [reply, reply])
+                # Each op owns its result
+                self.assertIsNot(results[0], results[1])
+                self.assertIs(client._batch_supported, True)
+
+
+class SubmitTest(unittest.IsolatedAsyncioTestCase):
+    """AndroidClient.submit() and the batch queue behind it"""
+
+    async def asyncSetUp(self):
+        self.client = AndroidClient()
+        self.transport = FakeTransport(batch_service)
+        self.client._make_request = self.transport  # type: ignore[method-assign]
+
+    async def test_idle_submit_is_sent_right_away(self):
+        result = await self.client.submit("/device/home")
+
+        self.assertEqual(self.transport.endpoints, ["/device/home"])
+        self.assertEqual(result, {"success": True, "path": "/device/home"})
+        self.assertIsNone(self.client._batch_flush_task)
+
+    async def test_submits_in_one_iteration_share_a_request(self):
+        results = await asyncio.gather(
+            self.client.submit("/device/back"),
+            self.client.submit("/device/home"),
+            self.client.submit("/device/recent"),
+        )
+
+        self.assertEqual(self.transport.endpoints, ["/batch"])
+        self.assertEqual([r["path"] for r in results], ["/device/back", "/device/home", "/device/recent"])
+
+    async def test_submits_during_a_request_are_coalesced(self):
+        self.transport.gate.clear()
+        first = asyncio.create_task(self.client.submit("/device/back"))
+        await self.transport.wait_for_calls(1)
+        # The first op is now in flight on its own
+        self.assertEqual(self.transport.endpoints, ["/device/back"])
+
+        later = [
+            asyncio.create_task(self.client.submit("/ui/scroll", {"direction": "up", "steps": 2})),
+            asyncio.create_task(self.client.submit("/device/home")),
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # Queued behind the request in flight rather than sent
+        self.assertEqual(self.transport.endpoints, ["/device/back"])
+
+        self.transport.gate.set()
+        results = await asyncio.gather(first, *later)
+
+        self.assertEqual(self.transport.endpoints, ["/device/back", "/batch"])
+        self.assertEqual(
+            self.transport.calls[1][2],
+            {"ops": [
+                {"path": "/ui/scroll", "body": {"direction": "up", "steps": 2}},
+                {"path": "/device/home", "body": None},
+            ]}
+        )
+        self.assertEqual([r["path"] for r in results], ["/device/back", "/ui/scroll", "/device/home"])
+
+    async def test_flush_waits_for_queued_ops(self):
+        self.transport.gate.clear()
+        pending = asyncio.create_task(self.client.submit("/device/back"))
+        await self.transport.wait_for_calls(1)
+
+        asyncio.get_running_loop().call_soon(self.transport.gate.set)
+        await self.client.flush()
+
+        self.assertTrue(pending.done())
+        self.assertIsNone(self.client._batch_flush_task)
+
+    async def test_failed_flush_fails_every_waiting_op(self):
+        async def broken(*args, **kwargs):
+            raise ValueError("boom")
+        self.client._make_request = broken  # type: ignore[method-assign]
+
+        results = await asyncio.gather(
+            self.client.submit("/device/back"),
+            self.client.submit("/device/home"),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertIsNone(self.client._batch_flush_task)
+
+    async def test_queue_keeps_draining_after_a_failed_request(self):
+        def fail_back(endpoint: str, data: Optional[Any]) -> Dict[str, Any]:
+            if endpoint == "/device/back":
+                raise ValueError("boom")
+            return batch_service(endpoint, data)
+        self.transport.respond = fail_back
+        self.transport.gate.clear()
+        first = asyncio.create_task(self.client.submit("/device/back"))
+        await self.transport.wait_for_calls(1)
+        second = asyncio.create_task(self.client.submit("/device/home"))
+
+        self.transport.gate.set()
+        await self.client.flush()
+
+        with self.assertRaises(ValueError):
+            await first
+        self.assertEqual(await second, {"success": True, "path": "/device/home"})
+        self.assertEqual(self.transport.endpoints, ["/device/back", "/device/home"])
+
+
+if __name__ == "__main__":
+    unittest.main()